@@ -11,15 +11,81 @@ This program generates clues for a two-phase nonogram puzzle:
 The program also visualizes the puzzle with matplotlib and provides an editor mode.
 """
 import sys
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.widgets import Button
+import importlib.util
+from pathlib import Path
 import numpy as np
 
+# matplotlib is imported inside the functions that draw, so that parsing and
+# clue generation do not pay its import time
+
+# Cell markers for each phase, as sets for O(1) membership tests in per-cell loops
+_SHADED = frozenset(('1', 'X'))  # Cells to be shaded in Phase 1
+_ERASED = frozenset(('2', 'X'))  # Cells to be erased in Phase 2
+
+# Compact cell codes are bit flags, so 'X' is both shaded and erased
+_SHADED_BIT = 1
+_ERASED_BIT = 2
+_CELL_CHARS = np.array(['-', '1', '2', 'X'])  # Indexed by cell code
+
+# Cell code for every character ordinal below 256; anything else is an empty cell
+_CELL_CODES = np.zeros(256, dtype=np.int8)
+_CELL_CODES[[ord(char) for char in _SHADED]] |= _SHADED_BIT
+_CELL_CODES[[ord(char) for char in _ERASED]] |= _ERASED_BIT
+
 def parse_grid(grid_str):
-    """Parse the input grid string into a 2D list."""
-    return [list(line.strip()) for line in grid_str.strip().split('\n')]
+    """Parse the input grid string into a 2D list.
+    Blank lines are skipped; every other line must have the same number of cells."""
+    grid = [list(line.strip()) for line in grid_str.splitlines() if line.strip()] or [[]]
+    for row_idx, row in enumerate(grid):
+        if len(row) != len(grid[0]):
+            raise ValueError(f"Row {row_idx + 1} has {len(row)} cells, expected {len(grid[0])}")
+    return grid
+
+def encode_grid(grid):
+    """Encode a grid of cell characters as an int8 array of phase bit flags.
+    Rows may be lists of characters or strings, but must all have the same length.
+    Characters other than '1', '2' and 'X' are treated as empty cells."""
+    rows = [''.join(row) for row in grid]
+    width = len(rows[0]) if rows else 0
+    if any(len(row) != width for row in rows):
+        raise ValueError("All grid rows must have the same length")
+    # Read the ordinals of the joined rows straight from their UTF-32 encoding,
+    # then classify every cell with one table lookup
+    ordinals = np.frombuffer(''.join(rows).encode('utf-32-le'), dtype=np.uint32)
+    return _CELL_CODES[np.minimum(ordinals, 255)].reshape(len(rows), width)
 
+def _run_lengths_numpy(mask):
+    """Return the run lengths of True cells in a 2D boolean mask, flattened in row
+    order, together with the number of runs in each row."""
+    height, width = mask.shape
+    # Pad each row with False on both sides so every run has a start and an end
+    padded = np.zeros((height, width + 2), dtype=bool)
+    padded[:, 1:-1] = mask
+    # Flat positions of every value change; within each row they alternate
+    # between run starts and run ends
+    edges = np.flatnonzero(padded[:, 1:] != padded[:, :-1])
+    starts, ends = edges[0::2], edges[1::2]
+    return ends - starts, np.bincount(starts // (width + 1), minlength=height)
+
+def _run_lengths(mask):
+    """Return the run lengths of True cells for each row of a 2D boolean mask.
+    Rows without any runs get [0], matching standard nonogram notation."""
+    if mask.shape[0] == 0:
+        return []
+    lengths, counts = _run_lengths_numpy(mask)
+    # Group the run lengths back into their rows, slicing plain lists since
+    # per-row NumPy splits cost more than the kernel itself on small grids
+    lengths = lengths.tolist()
+    clues = []
+    start = 0
+    for count in counts.tolist():
+        clues.append(lengths[start:start + count] if count else [0])
+        start += count
+    return clues
+
+# The per-phase generators stay plain loops: on puzzle-sized grids they are faster
+# than encoding the grid for the vectorized kernel, which generate_all_clues keeps
+# for the visualizer's already encoded grid
 def generate_shading_clues(grid):
     """Generate the phase 1 shading clues for rows and columns.
     Cells marked as '1' or 'X' are part of Phase 1 solution."""
@@ -28,7 +94,7 @@ def generate_shading_clues(grid):
         clues = []
         count = 0
         for cell in row:
-            if cell in ['1', 'X']:  # Cells to be shaded in Phase 1
+            if cell in _SHADED:  # Cells to be shaded in Phase 1
                 count += 1
             elif count > 0:
                 clues.append(count)
@@ -43,7 +109,7 @@ def generate_shading_clues(grid):
         count = 0
         for row_idx in range(len(grid)):
             cell = grid[row_idx][col_idx]
-            if cell in ['1', 'X']:  # Cells to be shaded in Phase 1
+            if cell in _SHADED:  # Cells to be shaded in Phase 1
                 count += 1
             elif count > 0:
                 clues.append(count)
@@ -62,7 +128,7 @@ def generate_erasing_clues(grid):
         clues = []
         count = 0
         for cell in row:
-            if cell in ['2', 'X']:  # Cells to be erased in Phase 2
+            if cell in _ERASED:  # Cells to be erased in Phase 2
                 count += 1
             elif count > 0:
                 clues.append(count)
@@ -77,7 +143,7 @@ def generate_erasing_clues(grid):
         count = 0
         for row_idx in range(len(grid)):
             cell = grid[row_idx][col_idx]
-            if cell in ['2', 'X']:  # Cells to be erased in Phase 2
+            if cell in _ERASED:  # Cells to be erased in Phase 2
                 count += 1
             elif count > 0:
                 clues.append(count)
@@ -88,18 +154,34 @@ def generate_erasing_clues(grid):
     
     return row_clues, col_clues
 
+def _phase_masks(codes):
+    """Stack the Phase 1 shading and Phase 2 erasing masks of an array of cell codes."""
+    return np.stack([(codes & _SHADED_BIT) != 0,   # Cells to be shaded in Phase 1
+                     (codes & _ERASED_BIT) != 0])  # Cells to be erased in Phase 2
+
+def generate_all_clues(grid):
+    """Generate the shading and erasing clues for rows and columns in a single pass.
+    Accepts a grid of cell characters or an array from encode_grid.
+    Returns (shading_row_clues, shading_col_clues, erasing_row_clues, erasing_col_clues)."""
+    codes = grid if isinstance(grid, np.ndarray) and grid.dtype == np.int8 else encode_grid(grid)
+    height, width = codes.shape
+    # Stack both phase masks so rows and columns are each scanned once
+    masks = _phase_masks(codes)
+    row_clues = _run_lengths(masks.reshape(2 * height, width))
+    col_clues = _run_lengths(masks.transpose(0, 2, 1).reshape(2 * width, height))
+    return row_clues[:height], col_clues[:width], row_clues[height:], col_clues[width:]
+
 class NonoGramVisualizer:
     def __init__(self, grid, editor_mode=False):
-        self.grid = grid
-        self.height = len(grid)
-        self.width = len(grid[0])
+        self._grid = encode_grid(grid)  # One int8 phase code per cell
+        self.height, self.width = self._grid.shape
         self.editor_mode = editor_mode
         self.editor_phase = 1  # Start with Phase 1 in editor mode
         self.click_enabled = True  # Flag to control click processing
         
         # Generate clues
-        self.shading_row_clues, self.shading_col_clues = generate_shading_clues(grid)
-        self.erasing_row_clues, self.erasing_col_clues = generate_erasing_clues(grid)
+        (self.shading_row_clues, self.shading_col_clues,
+         self.erasing_row_clues, self.erasing_col_clues) = generate_all_clues(self._grid)
         
         # Calculate max number of clues for sizing
         self.max_row_clues = max(len(clues) for clues in self.shading_row_clues)
@@ -113,16 +195,74 @@ class NonoGramVisualizer:
         
         if editor_mode:
             self.current_phase = 2  # Show the final state in editor mode
-        
+
+        # Corner vertices of every cell in row-major order, shape (H*W, 4, 2)
+        rows, cols = np.divmod(np.arange(self.height * self.width), self.width)
+        corners = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+        origins = np.column_stack([cols, self.height - rows - 1])
+        self.cell_verts = origins[:, np.newaxis, :] + corners
+        self.build_phase_cells()
+
+        # Track which parts of the figure need updating on the next draw
+        self._title_dirty = True
+        self._cells_dirty = True
+        self._clues_dirty = True
+
+    @property
+    def grid(self):
+        """The grid as a 2D list of cell characters.
+        This is a fresh copy decoded from the int8 cell codes, so editing it does not
+        change the puzzle; assign a whole new grid to the property instead."""
+        return _CELL_CHARS[self._grid].tolist()
+
+    @grid.setter
+    def grid(self, grid):
+        """Replace the grid with one of the same shape and refresh its clues and cells"""
+        codes = encode_grid(grid)
+        if codes.shape != self._grid.shape:
+            raise ValueError(f"Grid must be {self.height}x{self.width}, got {codes.shape[0]}x{codes.shape[1]}")
+        self._grid = codes
+        (self.shading_row_clues, self.shading_col_clues,
+         self.erasing_row_clues, self.erasing_col_clues) = generate_all_clues(self._grid)
+        self.build_phase_cells()
+        self._cells_dirty = self._clues_dirty = True
+
+    def build_phase_cells(self):
+        """Precompute the cell vertices of the fill, shade and erase layers for each phase.
+        Phases are keyed by editor phase in editor mode and by viewing phase otherwise."""
+        codes = self._grid.ravel()
+        shaded = self.cell_verts[(codes & _SHADED_BIT) != 0]
+        erased = self.cell_verts[(codes & _ERASED_BIT) != 0]
+        empty = self.cell_verts[:0]
+
+        if self.editor_mode:
+            self.phase_cells = {
+                1: (empty, shaded, empty),    # Phase 1 editing: show only phase 1 cells
+                2: (shaded, empty, erased),   # Phase 2 editing: phase 1 cells, then phase 2 cells
+            }
+        else:
+            self.phase_cells = {
+                0: (empty, empty, empty),            # Empty grid in initial phase
+                1: (empty, shaded, empty),           # Phase 1: Apply foundation protocol
+                2: (self.cell_verts, empty, erased), # Phase 2: Fill everything, then show erased cells
+            }
+
     def setup_figure(self):
+        select_backend()  # Before pyplot is imported, which settles the backend
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection, PolyCollection
+
         # Create the figure with enough space for clues
         self.fig, self.ax = plt.subplots()
+        # Fixed axes extents leave room for the title above and the instructions below,
+        # without running the tight_layout solver
+        self.ax.set_position([0.025, 0.1, 0.95, 0.8])
         
         # Set title based on current phase
         if self.editor_mode:
-            self.fig.suptitle("Nonogram Editor Mode - Phase 1: Shading", fontsize=16)
+            self.title = self.fig.suptitle("Nonogram Editor Mode - Phase 1: Shading", fontsize=16)
         else:
-            self.fig.suptitle(self.phases[self.current_phase], fontsize=16)
+            self.title = self.fig.suptitle(self.phases[self.current_phase], fontsize=16)
         
         # Create keyboard binding for navigation
         if not self.editor_mode:
@@ -132,6 +272,95 @@ class NonoGramVisualizer:
             self.fig.canvas.mpl_connect('button_press_event', self.on_click)
             # Connect keyboard event for editor mode
             self.fig.canvas.mpl_connect('key_press_event', self.handle_key_press)
+
+        # Re-capture the blit background whenever the whole canvas is drawn
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+        self._background = None
+
+        # Key presses schedule a redraw about one frame later, so a burst of presses
+        # collapses into a single draw of the latest state
+        self._redraw_timer = self.fig.canvas.new_timer(interval=16)
+        self._redraw_timer.single_shot = True
+        self._redraw_timer.add_callback(self.draw_puzzle)
+
+        # Calculate grid offsets for clues
+        row_offset = max(2.5, self.max_row_clues * 0.7)
+        col_offset = max(2.5, self.max_col_clues * 0.6)
+
+        # Draw the grid as two collections of lines spanning the whole axes,
+        # horizontal in (axes x, data y) and vertical in (data x, axes y)
+        hlines = [[(0, i), (1, i)] for i in range(self.height + 1)]
+        vlines = [[(j, 0), (j, 1)] for j in range(self.width + 1)]
+        self.ax.add_collection(LineCollection(hlines, colors='black', linewidths=1,
+                                              transform=self.ax.get_yaxis_transform()),
+                               autolim=False)
+        self.ax.add_collection(LineCollection(vlines, colors='black', linewidths=1,
+                                              transform=self.ax.get_xaxis_transform()),
+                               autolim=False)
+
+        # Cell layers: solid fill, Phase 1 shading, Phase 2 erasing
+        self.fill_cells = PolyCollection([], facecolor='gray', edgecolor='black')
+        self.shade_cells = PolyCollection([], facecolor='gray', edgecolor='black',
+                                          hatch='xxx', alpha=0.7)
+        self.erase_cells = PolyCollection([], facecolor='white', edgecolor='black',
+                                          hatch='///', alpha=0.7)
+        for cells in (self.fill_cells, self.shade_cells, self.erase_cells):
+            self.ax.add_collection(cells, autolim=False)
+
+        # Clue labels keyed by (side, index, phase); only their text changes later
+        self.clue_texts = {}
+        for i in range(self.height):
+            # -- Phase 1 clues (black) --
+            self.clue_texts[('row', i, 1)] = self.ax.text(
+                -0.5, self.height-i-0.5, '', ha='right', va='center', fontsize=10)
+            # -- Phase 2 clues (red) --
+            self.clue_texts[('row', i, 2)] = self.ax.text(
+                -0.5, self.height-i-0.8, '', ha='right', va='center', fontsize=10, color='red')
+        for j in range(self.width):
+            # -- Phase 1 clues (black) --
+            self.clue_texts[('col', j, 1)] = self.ax.text(
+                j+0.5, self.height+0.1, '', ha='center', va='bottom', fontsize=10)
+            # -- Phase 2 clues (red) --
+            self.clue_texts[('col', j, 2)] = self.ax.text(
+                j+0.8, self.height+0.1, '', ha='center', va='bottom', fontsize=10, color='red')
+
+        # Everything that changes between phases is drawn by blitting
+        self.animated_artists = [self.title, self.fill_cells, self.shade_cells,
+                                 self.erase_cells, *self.clue_texts.values()]
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+
+        # Set the view limits
+        self.ax.set_xlim(-row_offset, self.width)
+        self.ax.set_ylim(-1, self.height + col_offset)
+
+        # Hide axis ticks
+        self.ax.set_xticks([])
+        self.ax.set_yticks([])
+
+    def on_draw(self, event):
+        """Store the static background after a full draw and paint the animated artists on top"""
+        canvas = event.canvas
+        if canvas.is_saving():
+            # Saved axes already include their animated artists, but the figure skips the title
+            self.title.draw(event.renderer)
+            return
+        if canvas.supports_blit:
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self.animated_artists:
+            artist.draw(event.renderer)
+
+    def blit(self):
+        """Redraw only the animated artists over the cached background"""
+        canvas = self.fig.canvas
+        if self._background is None:
+            # Nothing cached yet, so fall back to a full draw
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        for artist in self.animated_artists:
+            self.fig.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
         
     def on_click(self, event):
         """Handle mouse clicks in editor mode"""
@@ -147,67 +376,72 @@ class NonoGramVisualizer:
             # Handle clicks based on the current editor phase
             if self.editor_phase == 1:
                 # Phase 1: Toggle between empty (-) and phase 1 (1)
-                if self.grid[row][col] == '-':
-                    self.grid[row][col] = '1'
-                else:
-                    self.grid[row][col] = '-'
+                self._grid[row, col] = _SHADED_BIT if self._grid[row, col] == 0 else 0
             else:  # editor_phase == 2
-                # Phase 2: Toggle between empty (-) and phase 2 (2)
-                if self.grid[row][col] == '-':
-                    self.grid[row][col] = '2'
-                elif self.grid[row][col] == '1':
-                    self.grid[row][col] = 'X'  # Both phase 1 and 2
-                elif self.grid[row][col] == 'X':
-                    self.grid[row][col] = '1'  # Back to just phase 1
-                elif self.grid[row][col] == '2':
-                    self.grid[row][col] = '-'  # Back to empty
+                # Phase 2: Toggle the phase 2 flag, keeping any phase 1 shading
+                # (- <-> 2, 1 <-> X)
+                self._grid[row, col] ^= _ERASED_BIT
                 
-            # Update clues
-            self.shading_row_clues, self.shading_col_clues = generate_shading_clues(self.grid)
-            self.erasing_row_clues, self.erasing_col_clues = generate_erasing_clues(self.grid)
+            # Update clues and cell layers
+            self.update_clues_at(row, col)
+            self.build_phase_cells()
             
             # Redraw the puzzle
+            self._cells_dirty = self._clues_dirty = True
             self.draw_puzzle()
     
+    def update_clues_at(self, row, col):
+        """Recompute only the clues of the row and column that contain an edited cell"""
+        self.shading_row_clues[row], self.erasing_row_clues[row] = _run_lengths(
+            _phase_masks(self._grid[row]))
+        self.shading_col_clues[col], self.erasing_col_clues[col] = _run_lengths(
+            _phase_masks(self._grid[:, col]))
+
+    def write_puzzle(self, filename="nonogram_puzzle.txt"):
+        """Write the grid to a file, one row of cell characters per line"""
+        # View each row of decoded characters as a single fixed-width string
+        rows = _CELL_CHARS[self._grid].view(f'<U{self.width}').ravel().tolist()
+        Path(filename).write_text('\n'.join(rows) + '\n')
+        print(f"Puzzle saved to {filename}")
+
     def save_grid(self, event=None):
         """Save the current grid to a file or advance to next editor phase"""
         if self.editor_phase == 1:
-            # Store grid state before transition to prevent bugs
-            grid_copy = [row[:] for row in self.grid]
-            
             # When in phase 1, advance to phase 2
             self.editor_phase = 2
-            self.fig.suptitle("Nonogram Editor Mode - Phase 2: Erasing", fontsize=16)
             print("Phase 1 completed. Now enter the cells to erase in Phase 2.")
             
             # Update the button text
             self.save_button.label.set_text("Complete")
             
-            # Restore grid state to prevent unwanted changes
-            self.grid = grid_copy
-            
-            # Update clues and redraw
-            self.shading_row_clues, self.shading_col_clues = generate_shading_clues(self.grid)
-            self.erasing_row_clues, self.erasing_col_clues = generate_erasing_clues(self.grid)
+            # Clicks keep the clues current, so only the title and cells change
+            self._title_dirty = self._cells_dirty = True
             self.draw_puzzle()
         else:
             # When in phase 2, save the completed puzzle
-            filename = "nonogram_puzzle.txt"
-            with open(filename, 'w') as f:
-                for row in self.grid:
-                    f.write(''.join(row) + '\n')
-            print(f"Puzzle saved to {filename}")
+            self.write_puzzle()
             
             # Close the figure
+            import matplotlib.pyplot as plt
             plt.close(self.fig)
             
     def next_phase(self, event=None):
         self.current_phase = (self.current_phase + 1) % 3
+        # Only the title and cells differ between viewing phases
+        self._title_dirty = self._cells_dirty = True
         self.draw_puzzle()
         
     def draw_puzzle(self):
-        self.ax.clear()
+        """Update the parts of the figure that changed since the last draw"""
+        if self._title_dirty:
+            self._update_title()
+        if self._cells_dirty:
+            self._update_cells()
+        if self._clues_dirty:
+            self._update_clues()
+        self.blit()
 
+    def _update_title(self):
         # Set title based on editor phase or viewing phase
         if self.editor_mode:
             if self.editor_phase == 1:
@@ -216,108 +450,33 @@ class NonoGramVisualizer:
                 self.fig.suptitle("Nonogram Editor Mode - Phase 2: Erasing", fontsize=16)
         else:
             self.fig.suptitle(self.phases[self.current_phase], fontsize=16)
+        self._title_dirty = False
 
-        # Calculate grid offsets for clues
-        row_offset = max(2.5, self.max_row_clues * 0.7)
-        col_offset = max(2.5, self.max_col_clues * 0.6)
-
-        # Draw the grid
-        for i in range(self.height + 1):
-            self.ax.axhline(y=i, color='black', linestyle='-', linewidth=1)
-        for j in range(self.width + 1):
-            self.ax.axvline(x=j, color='black', linestyle='-', linewidth=1)
-
-        # Fill cells based on phase or editor mode
-        for i in range(self.height):
-            for j in range(self.width):
-                cell = self.grid[i][j]
-
-                if self.current_phase == 0 and not self.editor_mode:  
-                    # Empty grid in initial phase
-                    pass
-                elif self.current_phase == 1 and not self.editor_mode:  
-                    # Phase 1: Apply foundation protocol
-                    if cell in ['1', 'X']:
-                        rect = patches.Rectangle((j, self.height-i-1), 1, 1,
-                                               facecolor='gray', edgecolor='black',
-                                               hatch='xxx', alpha=0.7)
-                        self.ax.add_patch(rect)
-                else:  
-                    # Phase 2 or editor mode
-                    if self.editor_mode:
-                        # Show different visualizations based on editor phase
-                        if self.editor_phase == 1:
-                            # Phase 1 editing: show only phase 1 cells
-                            if cell in ['1', 'X']:
-                                rect = patches.Rectangle((j, self.height-i-1), 1, 1,
-                                                     facecolor='gray', edgecolor='black',
-                                                     hatch='xxx', alpha=0.7)
-                                self.ax.add_patch(rect)
-                        else:
-                            # Phase 2 editing: show all cells
-                            # First show phase 1 cells
-                            if cell in ['1', 'X']:
-                                rect = patches.Rectangle((j, self.height-i-1), 1, 1,
-                                                     facecolor='gray', edgecolor='black')
-                                self.ax.add_patch(rect)
-                            
-                            # Then highlight phase 2 cells
-                            if cell in ['2', 'X']:
-                                rect = patches.Rectangle((j, self.height-i-1), 1, 1,
-                                                     facecolor='white', edgecolor='black',
-                                                     hatch='///', alpha=0.7)
-                                self.ax.add_patch(rect)
-                    else:
-                        # Phase 2: Fill everything, then show erased cells
-                        # First fill everything
-                        rect = patches.Rectangle((j, self.height-i-1), 1, 1,
-                                               facecolor='gray', edgecolor='black')
-                        self.ax.add_patch(rect)
-                        
-                        # Then show cells that should be erased with a distinctive pattern
-                        if cell in ['2', 'X']:
-                            rect = patches.Rectangle((j, self.height-i-1), 1, 1,
-                                                 facecolor='white', edgecolor='black', 
-                                                 hatch='///', alpha=0.7)
-                            self.ax.add_patch(rect)
+    def _update_cells(self):
+        phase = self.editor_phase if self.editor_mode else self.current_phase
+        fill, shade, erase = self.phase_cells[phase]
+        self.fill_cells.set_verts(fill)
+        self.shade_cells.set_verts(shade)
+        self.erase_cells.set_verts(erase)
+        self._cells_dirty = False
 
+    def _update_clues(self):
         # -- Row Clues --
         for i, clues in enumerate(self.shading_row_clues):
-            # -- Phase 1 clues (black) --
-            clue_text = ' '.join(map(str, clues))
-            self.ax.text(-0.5, self.height-i-0.5, clue_text,
-                         ha='right', va='center', fontsize=10)
-            
-            # -- Phase 2 clues (red) --
+            self.clue_texts[('row', i, 1)].set_text(' '.join(map(str, clues)))
             erasing_clues = self.erasing_row_clues[i]
-            if erasing_clues != [0]:
-                erasing_text = ' '.join(map(str, erasing_clues))
-                self.ax.text(-0.5, self.height-i-0.8, erasing_text,
-                             ha='right', va='center', fontsize=10, color='red')
+            erasing_text = self.clue_texts[('row', i, 2)]
+            erasing_text.set_text(' '.join(map(str, erasing_clues)))
+            erasing_text.set_visible(erasing_clues != [0])
 
         # -- Column Clues --
         for j, clues in enumerate(self.shading_col_clues):
-            # -- Phase 1 clues (black) --
-            clue_text = '\n'.join(map(str, clues))
-            self.ax.text(j+0.5, self.height+0.1, clue_text,
-                         ha='center', va='bottom', fontsize=10)
-            
-            # -- Phase 2 clues (red) --
+            self.clue_texts[('col', j, 1)].set_text('\n'.join(map(str, clues)))
             erasing_clues = self.erasing_col_clues[j]
-            if erasing_clues != [0]:
-                erasing_text = '\n'.join(map(str, erasing_clues))
-                self.ax.text(j+0.8, self.height+0.1, erasing_text,
-                             ha='center', va='bottom', fontsize=10, color='red')
-
-        # Set the view limits
-        self.ax.set_xlim(-row_offset, self.width)
-        self.ax.set_ylim(-1, self.height + col_offset)
-
-        # Hide axis ticks
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-
-        plt.draw()
+            erasing_text = self.clue_texts[('col', j, 2)]
+            erasing_text.set_text('\n'.join(map(str, erasing_clues)))
+            erasing_text.set_visible(erasing_clues != [0])
+        self._clues_dirty = False
 
     def visualize(self):
         self.setup_figure()
@@ -327,9 +486,8 @@ class NonoGramVisualizer:
         self.ax.text(self.width/2, -2.0, instruction, ha="center", va="center", 
                     fontsize=12, fontweight="bold", color="blue",
                     bbox=dict(boxstyle="round", fc="white", ec="blue", alpha=0.8))
-            
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.9, bottom=0.1)
+
+        import matplotlib.pyplot as plt
         plt.show()
 
     def handle_key_press(self, event):
@@ -338,35 +496,26 @@ class NonoGramVisualizer:
             if self.editor_mode:
                 # In editor mode, use Enter to advance phase or save
                 if self.editor_phase == 1:
-                    # Store grid state before transition to prevent bugs
-                    grid_copy = [row[:] for row in self.grid]
-                    
                     # Advance to phase 2
                     self.editor_phase = 2
-                    self.fig.suptitle("Nonogram Editor Mode - Phase 2: Erasing", fontsize=16)
                     print("Phase 1 completed. Now enter the cells to erase in Phase 2.")
                     
-                    # Restore grid state to prevent unwanted changes
-                    self.grid = grid_copy
-                    
-                    # Update clues and redraw
-                    self.shading_row_clues, self.shading_col_clues = generate_shading_clues(self.grid)
-                    self.erasing_row_clues, self.erasing_col_clues = generate_erasing_clues(self.grid)
-                    self.draw_puzzle()
+                    # Clicks keep the clues current, so only the title and cells change
+                    self._title_dirty = self._cells_dirty = True
+                    self._redraw_timer.start()
                 else:
                     # Save the completed puzzle
-                    filename = "nonogram_puzzle.txt"
-                    with open(filename, 'w') as f:
-                        for row in self.grid:
-                            f.write(''.join(row) + '\n')
-                    print(f"Puzzle saved to {filename}")
+                    self.write_puzzle()
                     
-                    # Close the figure
+                    # Close the figure, dropping any redraw still pending
+                    import matplotlib.pyplot as plt
+                    self._redraw_timer.stop()
                     plt.close(self.fig)
             else:
                 # In viewing mode, use Enter to advance phase
                 self.current_phase = (self.current_phase + 1) % 3
-                self.draw_puzzle()
+                self._title_dirty = self._cells_dirty = True
+                self._redraw_timer.start()
 
 def process_nonogram(grid_str):
     """Process the nonogram grid and visualize it."""
@@ -376,15 +525,31 @@ def process_nonogram(grid_str):
 
 def create_empty_grid(width, height):
     """Create an empty grid with specified dimensions."""
-    return [['-' for _ in range(width)] for _ in range(height)]
+    return [['-'] * width for _ in range(height)]
+
+def select_backend():
+    """Use the faster mplcairo Qt backend when it is installed and no backend was
+    configured explicitly, through MPLBACKEND, a matplotlibrc or matplotlib.use."""
+    if importlib.util.find_spec('mplcairo') is None:
+        return
+    import matplotlib
+    if matplotlib.rcParams._get_backend_or_none() is not None:
+        return
+    try:
+        # pyplot is not imported yet, so matplotlib.use only records the name;
+        # load the backend here to find out whether Qt bindings exist
+        importlib.import_module('mplcairo.qt')
+        matplotlib.use('module://mplcairo.qt')
+    except ImportError:
+        pass  # No Qt bindings available, keep matplotlib's default backend
 
 def main():
     print("Squared Away Nonogram Generator")
 
     # Check if input is from a file/pipe or keyboard
     if not sys.stdin.isatty():
-        # Reading from file or pipe
-        grid_str = sys.stdin.read()
+        # Reading from file or pipe: take the raw bytes and decode once
+        grid_str = sys.stdin.buffer.read().decode('utf-8')
         process_nonogram(grid_str)
     else:
         # Editor mode